@@ -16,9 +16,11 @@
 
 import argparse
 import atexit
+import json
 import os
 import platform
 import re
+import selectors
 import shutil
 import signal
 import socket
@@ -27,10 +29,13 @@ import sys
 import tarfile
 import tempfile
 import time
+from pathlib import Path
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import urllib.request
 import requests
 import yt_dlp
+from requests.adapters import HTTPAdapter
 from stem import Signal
 from stem.control import Controller
 
@@ -44,23 +49,41 @@ TOR_CONTROL_PORT = 12213
 
 SAFE_COUNTRIES = ["se", "ch", "nl", "is", "no", "fi", "dk", "de"]
 
+CACHE_TTL_FFMPEG = 7 * 24 * 60 * 60  # seconds
+CACHE_TTL_TOR_INDEX = 6 * 60 * 60
+
+# Compiled once at import so per-call use skips the regex-cache lookup.
+SANITIZE_PATTERN = re.compile(r'[\\/:*?"<>|\n\r\t]')
+
+# Bytes pattern: the index HTML is ASCII, so matching the raw response
+# skips a full decode pass over the body.
+TOR_VERSION_PATTERN = re.compile(rb'href="([0-9.]+)/"')
+
+# One pooled session for all bootstrap downloads so TCP+TLS setup to each
+# host happens once instead of per request.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+HTTP_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 
 # =========================
 # Globals
 # =========================
 
-tor_process = None
-torrc_path = None
-tor_started_by_us = False
+tor_instances = []
 VERBOSE = False
 
+# Resolved install paths, cached so retries skip the filesystem scans.
+ffmpeg_path_cache = None
+tor_path_cache = None
+
 
 # =========================
 # Utility Functions
 # =========================
 
 def sanitize_filename(name: str) -> str:
-    name = re.sub(r'[\\/:*?"<>|\n\r\t]', "", name)
+    name = SANITIZE_PATTERN.sub("", name)
     return name.replace(" ", "_")
 
 
@@ -82,25 +105,39 @@ def download_with_watchdog(
     dest_path: str,
     label: str = "Downloading",
     timeout: int = 30,
-    chunk_size: int = 1024 * 64,
+    chunk_size: int = 1024 * 1024,
+    progress: bool = True,
 ):
     """
     Stream-download a file with progress output and a stall watchdog.
-    Aborts if no data is received for `timeout` seconds.
+    Aborts if no data is received for `timeout` seconds. Pass
+    `progress=False` for small files to skip the Python-level chunk loop
+    and let shutil copy in a tight C loop instead.
     """
-    last_data_time = time.time()
     downloaded = 0
 
-    with requests.get(url, stream=True, timeout=timeout) as r:
+    with HTTP_SESSION.get(url, stream=True, timeout=timeout) as r:
         r.raise_for_status()
+
+        if not progress:
+            r.raw.decode_content = True
+            with open(dest_path, "wb") as f:
+                shutil.copyfileobj(r.raw, f, length=1024 * 1024)
+            return r.headers
+
         total = int(r.headers.get("content-length", 0))
+        total_kb = total // 1024
 
-        start_time = time.time()
+        start_time = time.monotonic()
+        last_data_time = start_time
+        last_print = start_time
 
         with open(dest_path, "wb") as f:
             for chunk in r.iter_content(chunk_size=chunk_size):
+                now = time.monotonic()
+
                 if not chunk:
-                    if time.time() - last_data_time > timeout:
+                    if now - last_data_time > timeout:
                         raise RuntimeError(
                             f"{label} stalled for {timeout} seconds"
                         )
@@ -108,18 +145,22 @@ def download_with_watchdog(
 
                 f.write(chunk)
                 downloaded += len(chunk)
-                last_data_time = time.time()
+                last_data_time = now
 
-                # Progress output
-                elapsed = max(time.time() - start_time, 0.1)
-                speed = downloaded / elapsed / 1024  # KB/s
+                # Throttle progress output to ~10 Hz so terminal I/O never
+                # becomes the bottleneck on fast links.
+                if now - last_print < 0.1:
+                    continue
+                last_print = now
+
+                speed = downloaded / (now - start_time) / 1024  # KB/s
 
                 if total:
                     percent = downloaded / total * 100
                     msg = (
                         f"\r{label}: "
                         f"{percent:6.2f}% "
-                        f"({downloaded // 1024} KB / {total // 1024} KB) "
+                        f"({downloaded // 1024} KB / {total_kb} KB) "
                         f"{speed:6.1f} KB/s"
                     )
                 else:
@@ -131,31 +172,257 @@ def download_with_watchdog(
 
                 print(msg, end="", flush=True)
 
+        headers = r.headers
+
+    # Final line so the output always ends at the true totals.
+    elapsed = max(time.monotonic() - start_time, 1e-6)
+    speed = downloaded / elapsed / 1024
+    if total:
+        print(
+            f"\r{label}: 100.00% ({downloaded // 1024} KB / {total_kb} KB) "
+            f"{speed:6.1f} KB/s"
+        )
+    else:
+        print(f"\r{label}: {downloaded // 1024} KB {speed:6.1f} KB/s")
+
+    return headers
+
+
+def download_ranged(
+    url: str,
+    dest_path: str,
+    label: str = "Downloading",
+    parts: int = 4,
+    timeout: int = 30,
+):
+    """
+    Download `url` into `dest_path` with `parts` parallel byte-range requests
+    to saturate bandwidth on large archives. Falls back to the single-stream
+    watchdog path when the server does not support ranges.
+    """
+    try:
+        head = HTTP_SESSION.head(url, timeout=timeout, allow_redirects=True)
+        head.raise_for_status()
+    except Exception:
+        return download_with_watchdog(url, dest_path, label=label, timeout=timeout)
+
+    total = int(head.headers.get("content-length", 0))
+
+    # Ranged fetch only pays off for sizeable files; tiny ones would get
+    # degenerate (or empty) ranges anyway.
+    if total < parts * 1024 * 64 or head.headers.get("accept-ranges", "").lower() != "bytes":
+        return download_with_watchdog(url, dest_path, label=label, timeout=timeout)
+
+    # Preallocate the file so each worker can write at its own offset.
+    with open(dest_path, "wb") as f:
+        f.truncate(total)
+
+    part_size = total // parts
+    bounds = [
+        (index * part_size, total - 1 if index == parts - 1 else (index + 1) * part_size - 1)
+        for index in range(parts)
+    ]
+
+    downloaded = [0] * parts
+    start_time = time.time()
+    total_kb = total // 1024
+
+    def fetch_part(index: int, lo: int, hi: int):
+        with HTTP_SESSION.get(
+            url,
+            headers={"Range": f"bytes={lo}-{hi}"},
+            stream=True,
+            timeout=timeout,
+        ) as r:
+            if r.status_code != 206:
+                raise RuntimeError(f"{label}: server ignored Range request")
+
+            with open(dest_path, "r+b") as f:
+                f.seek(lo)
+                for chunk in r.iter_content(chunk_size=1024 * 64):
+                    if chunk:
+                        f.write(chunk)
+                        downloaded[index] += len(chunk)
+
+    with ThreadPoolExecutor(max_workers=parts) as executor:
+        futures = [
+            executor.submit(fetch_part, index, lo, hi)
+            for index, (lo, hi) in enumerate(bounds)
+        ]
+
+        while True:
+            finished = all(future.done() for future in futures)
+
+            done_bytes = sum(downloaded)
+            elapsed = max(time.time() - start_time, 0.1)
+            speed = done_bytes / elapsed / 1024  # KB/s
+            percent = done_bytes / total * 100
+            print(
+                f"\r{label}: "
+                f"{percent:6.2f}% "
+                f"({done_bytes // 1024} KB / {total_kb} KB) "
+                f"{speed:6.1f} KB/s",
+                end="",
+                flush=True,
+            )
+
+            if finished:
+                break
+            time.sleep(0.1)
+
     print()  # newline after completion
 
+    try:
+        for future in futures:
+            future.result()
+    except Exception as e:
+        print(f"{label}: ranged download failed ({e}), retrying single-stream")
+        return download_with_watchdog(url, dest_path, label=label, timeout=timeout)
+
+    return head.headers
+
+
+def get_cache_dir() -> str:
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def download_with_cache(url: str, label: str, ttl: int) -> str:
+    """
+    Download `url` into the local .cache directory and return the cached path.
+    The cached copy is reused while its mtime is within `ttl`; stale entries
+    are revalidated against the server via ETag/Last-Modified/Content-Length
+    before being re-downloaded.
+    """
+    cache_path = os.path.join(get_cache_dir(), os.path.basename(url))
+    meta_path = cache_path + ".meta"
+
+    if os.path.exists(cache_path):
+        if time.time() - os.path.getmtime(cache_path) < ttl:
+            return cache_path
+
+        meta = {}
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+
+        try:
+            r = HTTP_SESSION.head(url, timeout=15, allow_redirects=True)
+            r.raise_for_status()
+            unchanged = bool(meta) and all(
+                meta.get(header) == r.headers.get(header)
+                for header in ("ETag", "Last-Modified", "Content-Length")
+            )
+        except Exception:
+            # Cannot revalidate (offline/flaky); keep the cached copy.
+            unchanged = True
+
+        if unchanged:
+            os.utime(cache_path)
+            return cache_path
+
+    # Download to a .part file first so an interrupted transfer never
+    # gets mistaken for a valid cached archive.
+    part_path = cache_path + ".part"
+    headers = download_ranged(url, part_path, label=label)
+    os.replace(part_path, cache_path)
+
+    with open(meta_path, "w") as f:
+        json.dump(
+            {header: headers.get(header) for header in ("ETag", "Last-Modified", "Content-Length")},
+            f,
+        )
+
+    return cache_path
+
+
+class ProgressReader:
+    """
+    File-like wrapper that counts bytes pulled through `read` and prints
+    the same progress line as download_with_watchdog. Lets us stream a
+    download straight into a consumer (e.g. tarfile) without losing output.
+    """
+
+    def __init__(self, raw, label: str, total: int = 0):
+        self.raw = raw
+        self.label = label
+        self.total = total
+        self.downloaded = 0
+        self.start_time = time.monotonic()
+        self.last_print = self.start_time
+
+    def read(self, size=-1):
+        chunk = self.raw.read(size)
+
+        if chunk:
+            self.downloaded += len(chunk)
+
+            # Same ~10 Hz throttle as download_with_watchdog.
+            now = time.monotonic()
+            if now - self.last_print < 0.1:
+                return chunk
+            self.last_print = now
+
+            elapsed = now - self.start_time
+            speed = self.downloaded / elapsed / 1024  # KB/s
+
+            if self.total:
+                percent = self.downloaded / self.total * 100
+                msg = (
+                    f"\r{self.label}: "
+                    f"{percent:6.2f}% "
+                    f"({self.downloaded // 1024} KB / {self.total // 1024} KB) "
+                    f"{speed:6.1f} KB/s"
+                )
+            else:
+                msg = (
+                    f"\r{self.label}: "
+                    f"{self.downloaded // 1024} KB "
+                    f"{speed:6.1f} KB/s"
+                )
+
+            print(msg, end="", flush=True)
+
+        return chunk
+
 
 # =========================
 # ffmpeg Bootstrap (RESTORED)
 # =========================
 
+def find_ffmpeg_executable(ffmpeg_dir: str):
+    # Gyan builds unpack to <build>/bin/ffmpeg.exe; fall back to a full
+    # recursive glob in case the archive layout ever changes.
+    hits = (
+        list(Path(ffmpeg_dir).glob("*/bin/ffmpeg.exe"))
+        or list(Path(ffmpeg_dir).rglob("ffmpeg.exe"))
+    )
+    return str(hits[0]) if hits else None
+
+
 def ensure_ffmpeg() -> str:
+    global ffmpeg_path_cache
+
+    if ffmpeg_path_cache:
+        return ffmpeg_path_cache
+
     script_dir = os.path.dirname(os.path.abspath(__file__))
     ffmpeg_dir = os.path.join(script_dir, "ffmpeg-latest")
 
-    for root, _, files in os.walk(ffmpeg_dir):
-        for file in files:
-            if file.lower() == "ffmpeg.exe":
-                return os.path.join(root, file)
+    ffmpeg_path = find_ffmpeg_executable(ffmpeg_dir)
+    if ffmpeg_path:
+        ffmpeg_path_cache = ffmpeg_path
+        return ffmpeg_path
 
     print("ffmpeg not found. Downloading ffmpeg...")
 
     ffmpeg_url = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-git-essentials.7z"
-    ffmpeg_7z = os.path.join(script_dir, "ffmpeg.7z")
 
-    download_with_watchdog(
+    ffmpeg_7z = download_with_cache(
         ffmpeg_url,
-        ffmpeg_7z,
-        label="ffmpeg"
+        label="ffmpeg",
+        ttl=CACHE_TTL_FFMPEG,
     )
 
     def find_7z():
@@ -168,7 +435,8 @@ def ensure_ffmpeg() -> str:
             download_with_watchdog(
                 "https://www.7-zip.org/a/7zr.exe",
                 sevenzip,
-                label="7-Zip"
+                label="7-Zip",
+                progress=False,
             )
         return sevenzip
 
@@ -179,12 +447,10 @@ def ensure_ffmpeg() -> str:
         check=True
     )
 
-    os.remove(ffmpeg_7z)
-
-    for root, _, files in os.walk(ffmpeg_dir):
-        for file in files:
-            if file.lower() == "ffmpeg.exe":
-                return os.path.join(root, file)
+    ffmpeg_path = find_ffmpeg_executable(ffmpeg_dir)
+    if ffmpeg_path:
+        ffmpeg_path_cache = ffmpeg_path
+        return ffmpeg_path
 
     raise RuntimeError("ffmpeg.exe not found after extraction")
 
@@ -193,57 +459,189 @@ def ensure_ffmpeg() -> str:
 # Tor Functions
 # =========================
 
-def renew_tor_ip():
-    with Controller.from_port(port=TOR_CONTROL_PORT) as controller:
-        controller.authenticate()
-        controller.signal(Signal.NEWNYM)
+def rotate_tor_circuit(instance: dict, country_code: str = None, timeout: int = 15) -> bool:
+    """
+    Point an already-running Tor instance at a (possibly new) exit country
+    and request a fresh circuit over its control port, keeping the warm
+    consensus instead of paying a full process restart. Returns True once
+    a circuit is established.
+    """
+    try:
+        with Controller.from_port(port=instance["control_port"]) as controller:
+            controller.authenticate()
+
+            if country_code:
+                controller.set_conf("ExitNodes", "{" + country_code + "}")
+                instance["country"] = country_code
 
+            controller.signal(Signal.NEWNYM)
+
+            start = time.monotonic()
+            while time.monotonic() - start < timeout:
+                if controller.get_info("status/circuit-established") == "1":
+                    return True
+                time.sleep(0.25)
+    except Exception as e:
+        print(f"Circuit rotation failed for {instance['country'].upper()}: {e}")
+
+    return False
 
-def is_tor_proxy_live(host="127.0.0.1", port=TOR_SOCKS_PORT, timeout=2):
-    try:
-        with socket.create_connection((host, port), timeout=timeout):
-            return True
-    except Exception:
-        return False
 
+def wait_for_port(port, host="127.0.0.1", timeout=2.0, process=None):
+    """
+    Wait for a local TCP port to accept connections using a non-blocking
+    connect registered with a selector, so readiness is noticed within
+    milliseconds of the listener opening instead of on the next sleep tick.
+    """
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            return False
+
+        sock = socket.socket()
+        sock.setblocking(False)
+
+        try:
+            if sock.connect_ex((host, port)) == 0:
+                return True
+
+            with selectors.DefaultSelector() as selector:
+                selector.register(sock, selectors.EVENT_WRITE)
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
 
-def test_tor_connection():
+                if selector.select(timeout=min(remaining, 0.5)):
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        return True
+                    # Refused: nothing is listening yet, back off briefly.
+                    time.sleep(0.05)
+        finally:
+            sock.close()
+
+    return False
+
+
+def test_tor_connection(socks_port: int = TOR_SOCKS_PORT):
+    """
+    Debug helper: report the exit IP as seen by check.torproject.org.
+    Costs a full round-trip through the circuit, so it only runs verbose.
+    """
     proxies = {
-        "http": f"socks5h://127.0.0.1:{TOR_SOCKS_PORT}",
-        "https": f"socks5h://127.0.0.1:{TOR_SOCKS_PORT}",
+        "http": f"socks5h://127.0.0.1:{socks_port}",
+        "https": f"socks5h://127.0.0.1:{socks_port}",
     }
-    r = requests.get("https://check.torproject.org/api/ip", proxies=proxies, timeout=10)
-    if r.ok:
-        data = r.json()
-        print(f"Tor IP: {data.get('IP')} | IsTor: {data.get('IsTor')}")
 
+    try:
+        r = requests.get(
+            "https://check.torproject.org/api/ip", proxies=proxies, timeout=10
+        )
+        if r.ok:
+            data = r.json()
+            print(f"Tor IP: {data.get('IP')} | IsTor: {data.get('IsTor')}")
+    except (requests.RequestException, ValueError) as e:
+        print(f"Tor check failed: {e}")
 
-def terminate_tor_process():
-    global tor_process, torrc_path, tor_started_by_us
 
-    if tor_process and tor_process.poll() is None and tor_started_by_us:
-        tor_process.terminate()
+def count_tor_exits_by_country(control_port: int) -> dict:
+    """
+    Count currently-advertised exit relays per country from an already
+    bootstrapped instance's consensus. Returns {} when the lookup fails
+    (e.g. GeoIP data unavailable), in which case callers skip filtering.
+    """
+    counts = {}
+
+    try:
+        with Controller.from_port(port=control_port) as controller:
+            controller.authenticate()
+
+            exit_addresses = [
+                status.address
+                for status in controller.get_network_statuses()
+                if "Exit" in status.flags
+            ]
+
+            # One batched GETINFO instead of a round-trip per relay.
+            lookups = controller.get_info(
+                [f"ip-to-country/{address}" for address in exit_addresses]
+            )
+
+            for country in lookups.values():
+                if country:
+                    counts[country] = counts.get(country, 0) + 1
+    except Exception as e:
+        print(f"Exit-node preflight failed: {e}")
+
+    return counts
+
+
+def terminate_tor_instance(instance: dict):
+    process = instance["process"]
+
+    if process and process.poll() is None:
+        process.terminate()
         try:
-            tor_process.wait(timeout=5)
+            process.wait(timeout=5)
         except Exception:
-            tor_process.kill()
+            process.kill()
+
+    if instance["torrc_path"] and os.path.exists(instance["torrc_path"]):
+        os.remove(instance["torrc_path"])
+        instance["torrc_path"] = None
+
+    if instance["data_dir"]:
+        shutil.rmtree(instance["data_dir"], ignore_errors=True)
+        instance["data_dir"] = None
+
+    if instance in tor_instances:
+        tor_instances.remove(instance)
 
-    tor_process = None
-    tor_started_by_us = False
 
-    if torrc_path and os.path.exists(torrc_path):
-        os.remove(torrc_path)
-        torrc_path = None
+def terminate_all_tor_instances():
+    for instance in list(tor_instances):
+        terminate_tor_instance(instance)
 
 
 # =========================
 # Tor Startup
 # =========================
 
+def get_latest_tor_version(index_url: str) -> str:
+    """
+    Resolve the newest stable Tor Expert Bundle version, caching the result
+    so repeated runs skip the index scrape entirely.
+    """
+    version_cache = os.path.join(get_cache_dir(), "tor-latest-version.txt")
+
+    if os.path.exists(version_cache):
+        if time.time() - os.path.getmtime(version_cache) < CACHE_TTL_TOR_INDEX:
+            with open(version_cache) as f:
+                return f.read().strip()
+
+    html = HTTP_SESSION.get(index_url, timeout=15).content
+
+    latest = max(
+        (v for v in TOR_VERSION_PATTERN.findall(html) if b"a" not in v),
+        key=lambda s: tuple(int(x) for x in s.split(b".")),
+    ).decode("ascii")
+
+    with open(version_cache, "w") as f:
+        f.write(latest)
+
+    return latest
+
+
 def ensure_tor_files() -> str:
     """
     Ensure Tor Expert Bundle is present locally and return absolute path to tor.exe
     """
+    global tor_path_cache
+
+    if tor_path_cache:
+        return tor_path_cache
+
     script_dir = os.path.dirname(os.path.abspath(__file__))
     tor_dir = os.path.join(script_dir, "tor")
     tor_bin = "tor.exe" if os.name == "nt" else "tor"
@@ -254,6 +652,7 @@ def ensure_tor_files() -> str:
 
     # Already present → fast path
     if os.path.exists(tor_path) and os.path.exists(geoip) and os.path.exists(geoip6):
+        tor_path_cache = tor_path
         return tor_path
 
     print("Required Tor files missing. Downloading Tor Expert Bundle...")
@@ -280,68 +679,90 @@ def ensure_tor_files() -> str:
 
 
     index_url = "https://dist.torproject.org/torbrowser/"
-    html = urllib.request.urlopen(index_url).read().decode()
-
-    versions = [
-        v for v in re.findall(r'href="([0-9.]+)/"', html) if "a" not in v
-    ]
-    versions.sort(key=lambda s: list(map(int, s.split("."))))
-    latest = versions[-1]
+    latest = get_latest_tor_version(index_url)
 
     version_url = f"{index_url}{latest}/"
-    html = urllib.request.urlopen(version_url).read().decode()
+    html = HTTP_SESSION.get(version_url, timeout=15).content
 
-    pattern = rf"tor-expert-bundle-{os_handle}-{arch}-.*?\.tar\.gz"
+    pattern = rf"tor-expert-bundle-{os_handle}-{arch}-.*?\.tar\.gz".encode("ascii")
     match = re.search(pattern, html)
     if not match:
         raise RuntimeError("Could not locate Tor Expert Bundle")
 
-    tarball = match.group(0)
-    tarball_path = os.path.join(script_dir, tarball)
+    tarball = match.group(0).decode("ascii")
 
-    print(f"Downloading {tarball}...")
-    download_with_watchdog(
-        version_url + tarball,
-        tarball_path,
-        label=f"Tor {latest}"
-    )
+    print(f"Downloading and extracting {tarball}...")
 
+    # Stream the tarball straight into tarfile ("r|gz" is single-pass, no
+    # seeking) so the archive is never written to disk first.
+    with HTTP_SESSION.get(version_url + tarball, stream=True, timeout=30) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True
+
+        reader = ProgressReader(
+            r.raw,
+            label=f"Tor {latest}",
+            total=int(r.headers.get("content-length", 0)),
+        )
 
-    print("Extracting Tor...")
-    with tarfile.open(tarball_path, "r:gz") as tar:
-        tar.extractall(script_dir)
+        # Collect member names while the stream extracts so the move step
+        # below works from tar metadata instead of rescanning the tree.
+        member_names = []
+        with tarfile.open(fileobj=reader, mode="r|gz") as tar:
+            for member in tar:
+                tar.extract(member, script_dir)
+                member_names.append(member.name)
 
-    os.remove(tarball_path)
+    print()  # newline after progress output
 
     os.makedirs(tor_dir, exist_ok=True)
     data_dir = os.path.join(script_dir, "data")
     os.makedirs(data_dir, exist_ok=True)
 
-    for root, _, files in os.walk(script_dir):
-        for file in files:
-            if file in {"tor", "tor.exe"}:
-                shutil.move(os.path.join(root, file), os.path.join(tor_dir, file))
-            elif file in {"geoip", "geoip6"}:
-                shutil.move(os.path.join(root, file), os.path.join(data_dir, file))
+    # Move only the files the tarball actually contained, O(tar entries)
+    # instead of rescanning the install directory.
+    for name in member_names:
+        base = os.path.basename(name)
+        extracted = os.path.join(script_dir, name)
 
-    return tor_path
+        if base in {"tor", "tor.exe"}:
+            destination = os.path.join(tor_dir, base)
+        elif base in {"geoip", "geoip6"}:
+            destination = os.path.join(data_dir, base)
+        else:
+            continue
 
+        if os.path.abspath(extracted) != os.path.abspath(destination):
+            shutil.move(extracted, destination)
 
-def start_tor_process(country_code: str):
-    global tor_process, torrc_path, tor_started_by_us
+    tor_path_cache = tor_path
+    return tor_path
 
-    terminate_tor_process()
 
+def start_tor_process(
+    country_code: str,
+    socks_port: int,
+    control_port: int,
+    tor_path: str = None,
+) -> dict:
+    """
+    Launch a Tor instance pinned to `country_code` on its own SOCKS/control
+    port pair, and return an instance record for readiness checks and teardown.
+    """
     # Ensure Tor exists and get absolute path
-    tor_path = ensure_tor_files()
+    if tor_path is None:
+        tor_path = ensure_tor_files()
     if not os.path.exists(tor_path):
         raise RuntimeError(f"Tor executable not found at {tor_path}")
 
+    data_dir = tempfile.mkdtemp(prefix=f"tor-data-{country_code}-")
+
     torrc_content = f"""
 GeoIPFile ./data/geoip
 GeoIPv6File ./data/geoip6
-SocksPort {TOR_SOCKS_PORT}
-ControlPort {TOR_CONTROL_PORT}
+DataDirectory {data_dir}
+SocksPort {socks_port}
+ControlPort {control_port}
 ExitNodes {{{country_code}}}
 """
 
@@ -349,22 +770,55 @@ ExitNodes {{{country_code}}}
         f.write(torrc_content)
         torrc_path = f.name
 
-    tor_process = subprocess.Popen(
+    process = subprocess.Popen(
         [tor_path, "-f", torrc_path],
         stdout=subprocess.PIPE if VERBOSE else subprocess.DEVNULL,
         stderr=subprocess.PIPE if VERBOSE else subprocess.DEVNULL,
         text=True,
     )
 
-    tor_started_by_us = True
+    instance = {
+        "country": country_code,
+        "socks_port": socks_port,
+        "control_port": control_port,
+        "process": process,
+        "torrc_path": torrc_path,
+        "data_dir": data_dir,
+    }
+    tor_instances.append(instance)
+    return instance
 
 
-def wait_for_tor(timeout=40):
-    start = time.time()
-    while time.time() - start < timeout:
-        if is_tor_proxy_live():
-            return True
-        time.sleep(1)
+def wait_for_tor(control_port=TOR_CONTROL_PORT, timeout=40, process=None):
+    """
+    Wait for a Tor instance to finish bootstrapping by polling the control
+    port's bootstrap phase. The SOCKS port accepts connections well before
+    circuits are usable; PROGRESS=100 means they actually are.
+    """
+    start = time.monotonic()
+
+    while time.monotonic() - start < timeout:
+        remaining = timeout - (time.monotonic() - start)
+
+        # Event-driven wait for the control port itself; the selector wakes
+        # us the moment tor opens its listener.
+        if not wait_for_port(control_port, timeout=remaining, process=process):
+            return False
+
+        try:
+            with Controller.from_port(port=control_port) as controller:
+                controller.authenticate()
+
+                while time.monotonic() - start < timeout:
+                    if process is not None and process.poll() is not None:
+                        return False
+                    if "PROGRESS=100" in controller.get_info("status/bootstrap-phase"):
+                        return True
+                    time.sleep(0.25)
+        except Exception:
+            # Control session dropped; reconnect until the deadline.
+            continue
+
     return False
 
 
@@ -374,45 +828,125 @@ def wait_for_tor(timeout=40):
 
 def download_video(url: str):
     ffmpeg_path = ensure_ffmpeg()
+    tor_path = ensure_tor_files()
     downloads = get_downloads_folder()
 
-    ydl_opts = {
-        "format": "bestvideo[height<=1080]+bestaudio/best",
-        "proxy": f"socks5://127.0.0.1:{TOR_SOCKS_PORT}",
-        "ffmpeg_location": ffmpeg_path,
-        "outtmpl": os.path.join(downloads, "%(title)s.%(ext)s"),
-        "windowsfilenames": True,
-        "restrictfilenames": True,
-        "retries": 1,
-        "merge_output_format": "mp4",
-    }
+    print(f"\nStarting {len(SAFE_COUNTRIES)} Tor instances in parallel...")
 
-    for country in SAFE_COUNTRIES:
-        print(f"\nTrying Tor exit node: {country.upper()}")
-        start_tor_process(country)
+    # One instance per country, each on its own port pair. Instances that
+    # bootstrap but are not used right away stay warm as a retry pool.
+    instances = []
+    for index, country in enumerate(SAFE_COUNTRIES):
+        socks_port = TOR_SOCKS_PORT + 2 * index
+        control_port = TOR_CONTROL_PORT + 2 * index
+        instances.append(
+            start_tor_process(country, socks_port, control_port, tor_path=tor_path)
+        )
 
-        if not wait_for_tor():
-            print("Tor failed to start, trying next country")
-            continue
+    def attempt_download(instance: dict) -> bool:
+        country = instance["country"]
 
-        test_tor_connection()
+        print(f"\nTrying Tor exit node: {country.upper()}")
+
+        # Saves a full circuit round-trip (~0.5-2s) per attempt when quiet.
+        if VERBOSE:
+            test_tor_connection(instance["socks_port"])
+
+        ydl_opts = {
+            "format": "bestvideo[height<=1080]+bestaudio/best",
+            "proxy": f"socks5://127.0.0.1:{instance['socks_port']}",
+            "ffmpeg_location": ffmpeg_path,
+            "outtmpl": os.path.join(downloads, "%(title)s.%(ext)s"),
+            "windowsfilenames": True,
+            "restrictfilenames": True,
+            "retries": 1,
+            "merge_output_format": "mp4",
+        }
 
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 ydl.download([url])
             print("Download succeeded!")
-            return
+            return True
         except Exception as e:
             print(f"Failed via {country.upper()}: {e}")
+            return False
+
+    executor = ThreadPoolExecutor(max_workers=len(instances))
+    try:
+        futures = {
+            executor.submit(
+                wait_for_tor, instance["control_port"], process=instance["process"]
+            ): instance
+            for instance in instances
+        }
+
+        ready_instances = []
+        exit_counts = None
+
+        for future in as_completed(futures):
+            instance = futures[future]
+
+            # Instances dropped by the preflight are already terminated;
+            # their waiters just resolve quietly.
+            if instance not in tor_instances:
+                continue
+
+            if not future.result():
+                print(
+                    f"Tor failed to start for {instance['country'].upper()}, "
+                    "trying next country"
+                )
+                terminate_tor_instance(instance)
+                continue
+
+            # First consensus we can see: drop countries that advertise no
+            # exits at all instead of letting them stall out their waiters.
+            if exit_counts is None:
+                exit_counts = count_tor_exits_by_country(instance["control_port"])
+                for other in list(tor_instances):
+                    if other is instance or not exit_counts:
+                        continue
+                    if exit_counts.get(other["country"], 0) == 0:
+                        print(f"No exits advertised in {other['country'].upper()}, dropping")
+                        terminate_tor_instance(other)
+
+            if attempt_download(instance):
+                return
+
+            # Keep the instance running: its consensus stays warm for the
+            # rotation sweep below.
+            ready_instances.append(instance)
+
+        # Retry countries with more exits first; they are likelier to build
+        # a working circuit.
+        if exit_counts:
+            ready_instances.sort(
+                key=lambda inst: exit_counts.get(inst["country"], 0), reverse=True
+            )
+
+        # Every country failed once. Rotate fresh circuits over the control
+        # ports and retry instead of restarting any processes.
+        for instance in ready_instances:
+            print(f"\nRotating circuit for {instance['country'].upper()}...")
+            if not rotate_tor_circuit(instance):
+                continue
+            if attempt_download(instance):
+                return
 
-    print("All Tor exit nodes failed.")
+        print("All Tor exit nodes failed.")
+    finally:
+        # Kill remaining instances first so in-flight wait_for_tor calls
+        # notice their process died instead of polling out their timeout.
+        terminate_all_tor_instances()
+        executor.shutdown(wait=False)
 
 
 # =========================
 # Cleanup & Main
 # =========================
 
-atexit.register(terminate_tor_process)
+atexit.register(terminate_all_tor_instances)
 signal.signal(signal.SIGINT, lambda *_: sys.exit(0))
 signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
 